@@ -1,22 +1,188 @@
 from argparse import ArgumentParser
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from configparser import ConfigParser
 from pathlib import Path
 from typing import List
 import hashlib
+import mmap
 import pathvalidate
 from pathvalidate.argparse import sanitize_filepath_arg
 import re
 import sys
 import os
+import threading
 import zlib
 
+# libdeflate is noticeably faster than the stdlib zlib for one-shot
+# (de)compression; fall back to zlib when the binding is not installed
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+# blake3 is several times faster than SHA-1; batch hashing uses it to
+# fingerprint contents and skip re-hashing duplicate files entirely
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# numba JIT-compiles the loose object header scan to native code; the
+# compiled regex below remains the fallback
+try:
+    import numba
+    import numpy
+except ImportError:
+    numba = None
+
+
+def _probe_sha1() -> callable:
+    """Picks the fastest available SHA-1 constructor once at import.
+
+    Prefers the raw OpenSSL digest (skipping the collision-detection
+    wrapper used by the default constructor) when the interpreter
+    supports the 'usedforsecurity' flag. New contexts are minted by
+    copying a prepared template, so per-call work is a C-level state
+    copy instead of re-resolving the algorithm name through hashlib.
+    OpenSSL itself dispatches to the CPU's SHA extensions when cpuid
+    reports them, so no separate capability probe is needed here.
+
+    Returns:
+        callable: A zero-argument factory returning a new SHA-1 context.
+    """
+    try:
+        # probe once; openssl rejects the flag on older builds
+        template = hashlib.new("sha1", usedforsecurity=False)
+    except (TypeError, ValueError):
+        return hashlib.sha1
+    return template.copy
+
+
+_sha1_new = _probe_sha1()
+
+# loose objects are addressed by 40 hex chars; anything else is rejected
+# up front so the path helpers can skip per-call sanitizing
+_OBJECT_HASH_RE = re.compile(r"[0-9a-f]{40}")
+
+# loose object header: '<type> <size>\x00', parsed in one pass
+_OBJECT_HEADER_RE = re.compile(rb"(\w+) (\d+)\x00")
+
+# the header fits well within this many bytes (type + 20-digit size)
+_MAX_HEADER_LEN = 32
+
+# precomputed '<type> ' prefixes for the four object types, so header
+# building needs no f-string parsing or type-token encoding per object
+_TYPE_PREFIX = {
+    "blob": b"blob ",
+    "commit": b"commit ",
+    "tag": b"tag ",
+    "tree": b"tree ",
+}
+
+
+def _object_header(obj_type: str, size: int) -> bytes:
+    """Builds a '<type> <size>\x00' loose object header.
+
+    Args:
+        obj_type (str): The type of the object.
+        size (int): The size of the object payload in bytes.
+
+    Returns:
+        bytes: The encoded header.
+    """
+    return _TYPE_PREFIX[obj_type] + str(size).encode("ascii") + b"\x00"
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _scan_object_header(buf):  # pragma: no cover - compiled
+        """Scans a header buffer for the space and NUL separators.
+
+        Returns (space index, size, payload offset), all -1 on failure.
+        """
+        space = -1
+        size = 0
+        for i in range(buf.shape[0]):
+            char = buf[i]
+            if space < 0:
+                if char == 0x20:
+                    space = i
+            elif char == 0x00:
+                return space, size, i + 1
+            elif 0x30 <= char <= 0x39:
+                size = size * 10 + (char - 0x30)
+            else:
+                return -1, -1, -1
+        return -1, -1, -1
+
+
+# per-thread zlib compressor templates, cloned instead of re-initialized
+_compressor_cache = threading.local()
+
+
+def _fresh_compressor(level: int) -> "zlib._Compress":
+    """Returns a new zlib compressor for the given level.
+
+    A finished compressor cannot be reused (Z_FINISH invalidates its
+    state), but cloning a prepared per-thread template with copy() is
+    cheaper than allocating and initializing the ~256 KiB deflate
+    state from scratch for every object.
+
+    Args:
+        level (int): The compression level (1-9).
+
+    Returns:
+        zlib._Compress: A fresh compressor object.
+    """
+    templates = getattr(_compressor_cache, "templates", None)
+    if templates is None:
+        templates = _compressor_cache.templates = {}
+    template = templates.get(level)
+    if template is None:
+        template = templates[level] = zlib.compressobj(level)
+    return template.copy()
+
+
+def _parse_object_header(data: bytes) -> tuple | None:
+    """Parses a '<type> <size>\x00' loose object header.
+
+    Args:
+        data (bytes): The decompressed object, header first.
+
+    Returns:
+        tuple | None: (object type, size, payload offset), or None if
+            the header is malformed.
+    """
+    if numba is not None:
+        head = bytes(data[:_MAX_HEADER_LEN])
+        space, size, offset = _scan_object_header(
+            numpy.frombuffer(head, dtype=numpy.uint8)
+        )
+        # require a type, at least one size digit and the NUL terminator
+        if offset < 0 or space < 1 or offset - space < 3:
+            return None
+        try:
+            object_type = head[:space].decode("ascii")
+        except UnicodeDecodeError:
+            # corrupt type bytes: fail the same way the regex path does
+            return None
+        if offset - space - 2 >= 19:
+            # 19+ digit sizes can wrap the njit int64 accumulator;
+            # re-parse so the caller's size check reports the real value
+            size = int(head[space + 1 : offset - 1])
+        return object_type, size, offset
+    header = _OBJECT_HEADER_RE.match(data)
+    if header is None:
+        return None
+    return header.group(1).decode("ascii"), int(header.group(2)), header.end()
+
 
 class GitObject:
     def __init__(self, path: str, obj_type: str, data: bytes = None) -> None:
-        self.path: str = str(
-            Path(pathvalidate.sanitize_filepath(path, platform="auto")).resolve()
-        )
+        # callers hand in paths that were already sanitized and resolved
+        # (or hashes read back from the validated object store)
+        self.path: str = str(path)
         self.type: str = obj_type
         self.size: int = None
         self.hash: str = None
@@ -48,20 +214,68 @@ class GitObject:
 class GitBlob(GitObject):
     def __init__(self, path: str, data: bytes = None) -> None:
         super().__init__(path, "blob", data)
-        self.size = len(self.data)
+        if self.data is not None:
+            self.size = len(self.data)
+            header = _object_header(self.type, self.size)
+            # feed the header and data separately to avoid concatenating them
+            hasher = _sha1_new()
+            hasher.update(header)
+            hasher.update(self.data)
+            self.hash = hasher.hexdigest()
+        else:
+            # no data given, stream the file at the given path instead
+            self.size, self.hash = self._hash_file()
 
-        header = f"{self.type} {self.size}\x00".encode("utf-8")
-        header_with_data = header + self.data
-        self.hash = hashlib.sha1(header_with_data).hexdigest()
+    @classmethod
+    def from_file(cls, path: str) -> "GitBlob":
+        """Creates a blob by streaming the file through the hasher.
+
+        Peak memory stays at one read buffer regardless of the file
+        size. Intended for hash-only use: serializing later re-reads
+        the file, and a file that changed in between would no longer
+        match the hash, so callers that persist the blob should pass
+        the content to the constructor instead.
+
+        Args:
+            path (str): Path to the file to read the blob from.
+
+        Returns:
+            GitBlob: The blob for the file's contents.
+        """
+        return cls(path)
+
+    def _hash_file(self) -> tuple[int, str]:
+        """Hashes the file at the blob's path without loading it whole.
+
+        Returns:
+            tuple[int, str]: The file size and the object hash.
+        """
+        size = os.path.getsize(self.path)
+        header = _object_header(self.type, size)
+        hasher = _sha1_new()
+        hasher.update(header)
+        # reuse a single 1 MiB buffer for the read loop
+        buffer = memoryview(bytearray(2**20))
+        with open(self.path, "rb") as f:
+            while read := f.readinto(buffer):
+                hasher.update(buffer[:read])
+        return size, hasher.hexdigest()
 
     def serialize(self) -> bytes:
+        # load lazily when the blob was created from a file path
+        if self.data is None:
+            self.data = Path(self.path).read_bytes()
+        # deserialization may hand in a memoryview; normalize to bytes
+        # once here so callers (cat-file, compression) see real bytes
+        elif not isinstance(self.data, bytes):
+            self.data = bytes(self.data)
         return self.data
 
     def deserialize(self, data: bytes) -> None:
         self.data = data
 
     def __str__(self) -> str:
-        return f"{self.type} {self.size} {self.hash}\n{self.data.decode()}"
+        return f"{self.type} {self.size} {self.hash}\n{self.serialize().decode()}"
 
 
 class GitRepository:
@@ -71,6 +285,10 @@ class GitRepository:
         self.worktree: str = None
         self.git_dir: str = None
         self.config: ConfigParser = None
+        self._git_dir_path: Path = None
+        self._objects_dir: Path = None
+        self._known_shards: set = set()
+        self._compression_level: int = None
 
     def init(self, repo: str, force: bool = False) -> None:
         """Creates a new directory for the repo and initializes a '.git' directory.
@@ -80,7 +298,6 @@ class GitRepository:
             force (bool): If True, overwrites the existing repo.
         """
         self.worktree = repo
-        self.git_dir = self._get_git_dir()
         self.config = ConfigParser()
 
         # create the new repository
@@ -90,19 +307,41 @@ class GitRepository:
             print(f"[!] An error occurred while creating the repository: {e}")
             raise e
 
+        # cache the validated repository paths once; the per-object
+        # helpers reuse them instead of re-resolving on every call
+        self.git_dir = self._get_git_dir()
+        self._git_dir_path = Path(self.git_dir)
+        self._objects_dir = self._git_dir_path.joinpath("objects")
+
+        # specialize the object-path builder for this repository: once
+        # the objects dir is fixed, plain concatenation onto the baked-in
+        # prefix replaces the Path joins and attribute lookups per object
+        prefix = str(self._objects_dir) + os.sep
+
+        def _object_path(
+            hashed_object: str, _prefix: str = prefix, _sep: str = os.sep
+        ) -> str:
+            return _prefix + hashed_object[:2] + _sep + hashed_object[2:]
+
+        self._get_object_path = _object_path
+
         if not (force or Path(self.worktree).joinpath(".git").exists()):
             print(f"[!] Repository already exists: {self.worktree}")
             raise FileExistsError(f"Repository already exists: {self.worktree}")
 
         config_file = self._get_config_file()
-        if Path(config_file).exists():
-            self.config.read(config_file)
+        if not Path(config_file).exists():
+            if not force:
+                print(f"[!] Config file not found: {config_file}")
+                raise FileNotFoundError(f"Config file not found: {config_file}")
         elif not force:
-            print(f"[!] Config file not found: {config_file}")
-            raise FileNotFoundError(f"Config file not found: {config_file}")
-
-        if not force:
-            version = self.config.get("core", "repositoryformatversion")
+            # scan the tiny default config directly; spinning up a full
+            # ConfigParser for a single key is the bulk of init()'s cost
+            version = self._read_core_setting("repositoryformatversion")
+            if version is None:
+                # non-trivial config, fall back to the full parser
+                self.config.read(config_file)
+                version = self.config.get("core", "repositoryformatversion")
             if version != "0":
                 print(f"Unsupported repository format: {version}")
                 raise ValueError(f"Unsupported repository format: {version}")
@@ -147,24 +386,135 @@ class GitRepository:
             obj_type (str): The type of the object.
             write (bool): Whether to write the object to the object store.
         """
+        obj_hash = self._hash_one(path, obj_type, write)
+        print(obj_hash)
+
+    def _fingerprint_file(self, path: str) -> bytes:
+        """Computes a fast blake3 fingerprint of a file's contents.
+
+        Only used for in-process deduplication; the digest is never
+        persisted, so a non-SHA-1 hash is safe here.
+
+        Args:
+            path (str): Path to the file to fingerprint.
+
+        Returns:
+            bytes: The blake3 digest of the file's contents.
+        """
+        hasher = blake3.blake3()
+        # reuse a single 1 MiB buffer for the read loop
+        buffer = memoryview(bytearray(2**20))
+        with open(path, "rb") as f:
+            while read := f.readinto(buffer):
+                hasher.update(buffer[:read])
+        return hasher.digest()
+
+    def _hash_one(self, path: str, obj_type: str, write: bool) -> str:
+        """Hashes a single object and optionally writes it.
+
+        Args:
+            path (str): Path to the object to hash.
+            obj_type (str): The type of the object.
+            write (bool): Whether to write the object to the object store.
+
+        Returns:
+            str: The object hash.
+        """
         # read the object file
         sanitized_path = pathvalidate.sanitize_filepath(path, platform="auto")
         resolved_path = Path(sanitized_path).resolve()
-        content = resolved_path.read_bytes()
         # create the object based on the type
         if obj_type == "blob":
-            obj = GitBlob(resolved_path, content)
+            if write:
+                # writing persists the content: read once and hash that
+                # same buffer, so the stored data always matches the hash
+                obj = GitBlob(resolved_path, resolved_path.read_bytes())
+            else:
+                # hash-only: stream the file through the hasher
+                obj = GitBlob.from_file(resolved_path)
         elif obj_type == "commit":
-            obj = GitCommit(resolved_path, content)
+            obj = GitCommit(resolved_path, resolved_path.read_bytes())
         elif obj_type == "tag":
-            obj = GitTag(resolved_path, content)
+            obj = GitTag(resolved_path, resolved_path.read_bytes())
         elif obj_type == "tree":
-            obj = GitTree(resolved_path, content)
+            obj = GitTree(resolved_path, resolved_path.read_bytes())
         else:
             raise ValueError(f"Invalid object type: {obj_type}")
 
-        obj_hash = self._write_object(obj, write)
-        print(obj_hash)
+        return self._write_object(obj, write)
+
+    def hash_objects(
+        self,
+        paths: List[str],
+        obj_type: str = "blob",
+        write: bool = False,
+        processes: bool = False,
+    ) -> None:
+        """Hashes many objects in a single invocation.
+
+        Amortizes startup, argument parsing and config loading across
+        the whole batch, and spreads the per-file work over a thread
+        pool: hashlib and zlib release the GIL, so the hashing and
+        compression of different files genuinely run in parallel.
+
+        When blake3 is installed, blobs are first fingerprinted with it
+        (much cheaper than SHA-1); files whose contents were already
+        seen in the batch reuse the stored hash instead of re-running
+        the SHA-1/compress/write pipeline.
+
+        Args:
+            paths (List[str]): Paths to the objects to hash.
+            obj_type (str): The type of the objects.
+            write (bool): Whether to write the objects to the object store.
+            processes (bool): Use a process pool instead of threads,
+                sidestepping the GIL entirely for compress-bound imports.
+        """
+        if processes:
+            self._hash_objects_processes(paths, obj_type, write)
+            return
+        seen: dict = {}
+        seen_lock = threading.Lock()
+
+        def hash_one(path: str) -> str:
+            if blake3 is None or obj_type != "blob":
+                return self._hash_one(path, obj_type, write)
+            fingerprint = self._fingerprint_file(path)
+            with seen_lock:
+                cached = seen.get(fingerprint)
+            if cached is not None:
+                return cached
+            obj_hash = self._hash_one(path, obj_type, write)
+            with seen_lock:
+                seen[fingerprint] = obj_hash
+            return obj_hash
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # map() yields in submission order, keeping output stable
+            for obj_hash in executor.map(hash_one, paths):
+                print(obj_hash)
+
+    def _hash_objects_processes(
+        self, paths: List[str], obj_type: str, write: bool
+    ) -> None:
+        """Hashes a batch of objects across a process pool.
+
+        Workers hash and compress; the parent does all the disk writes
+        serially so the workers never contend on the filesystem.
+
+        Args:
+            paths (List[str]): Paths to the objects to hash.
+            obj_type (str): The type of the objects.
+            write (bool): Whether to write the objects to the object store.
+        """
+        level = self._get_compression_level()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for obj_hash, compressed_data in executor.map(
+                _hash_and_compress,
+                ((path, obj_type, level) for path in paths),
+            ):
+                if write:
+                    self._write_compressed(obj_hash, compressed_data)
+                print(obj_hash)
 
     def _read_object(self, hashed_object: str) -> GitObject:
         """Reads an object from the repository.
@@ -179,31 +529,41 @@ class GitRepository:
         Returns:
             GitObject: The object read from the repository.
         """
+        # validate the hash once; the path helpers below rely on it
+        if not _OBJECT_HASH_RE.fullmatch(hashed_object):
+            raise ValueError(f"Invalid object hash: {hashed_object}")
         # get the path to the object file
         path = self._get_object_path(hashed_object)
-        # read the compressed object
-        compressed_data = Path(path).read_bytes()
-        # decompress the object
-        data = self._decompress_object(compressed_data)
-        # read the object type
-        type_index = data.find(b" ")
-        object_type = data[:type_index].decode("utf-8")
-        # read the object size
-        size_index = data.find(b"\x00", type_index)
-        object_size = int(data[type_index + 1 : size_index].decode("ascii"))
+        # map the compressed object and decompress straight from the
+        # mapping, skipping the intermediate bytes copy of the file
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size > 0:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    data = self._decompress_object(mapped)
+            else:
+                data = self._decompress_object(b"")
+        finally:
+            os.close(fd)
+        # parse the '<type> <size>\x00' header in a single pass
+        header = _parse_object_header(data)
+        if header is None:
+            raise ValueError(f"Invalid object header: {data[:_MAX_HEADER_LEN]}")
+        object_type, object_size, data_index = header
         # validate the object size
-        if len(data) != object_size + size_index + 1:
+        if len(data) != object_size + data_index:
             raise ValueError(f"Invalid object size: {object_size}")
+        # slice the payload lazily instead of copying the tail
+        payload = memoryview(data)[data_index:]
         # create the object based on the type
-        data_index = size_index + 1
         if object_type == "blob":
-            git_object = GitBlob(self, data[data_index:])
+            git_object = GitBlob(self, payload)
         elif object_type == "tree":
-            git_object = GitTree(self, data[data_index:])
+            git_object = GitTree(self, payload)
         elif object_type == "commit":
-            git_object = GitCommit(self, data[data_index:])
+            git_object = GitCommit(self, payload)
         elif object_type == "tag":
-            git_object = GitTag(self, data[data_index:])
+            git_object = GitTag(self, payload)
         else:
             raise ValueError(f"Invalid object type: {object_type}")
 
@@ -216,47 +576,153 @@ class GitRepository:
         return name
 
     def _write_object(self, obj: GitObject, actually_write: bool = True) -> str:
-        # serialize the object
-        data = obj.serialize()
-        # create a header for the object
-        header = f"{obj.type} {len(data)}\x00".encode("utf-8")
-        obj_with_header = header + data
         # create the object hash
         object_hash = obj.hash
 
         if actually_write:
-            # get the path to the object file
-            path = self._get_object_path(object_hash)
-            # compress the object
-            compressed_data = self._compress_object(obj_with_header)
-            # write the compressed object
-            Path(path).write_bytes(compressed_data)
+            # serialize the object and build its header; hash-only
+            # callers never need the content loaded at all
+            data = obj.serialize()
+            header = _object_header(obj.type, len(data))
+            # compress the object, streaming the header and data separately
+            compressed_data = self._compress_object(
+                header, data, self._get_compression_level()
+            )
+            self._write_compressed(object_hash, compressed_data)
 
         return object_hash
 
+    def _write_compressed(self, object_hash: str, compressed_data: bytes) -> None:
+        """Writes an already compressed object into the object store.
+
+        Args:
+            object_hash (str): The hash of the object.
+            compressed_data (bytes): The compressed object, header included.
+        """
+        # validate the hash once; the path helpers below rely on it
+        if not _OBJECT_HASH_RE.fullmatch(object_hash):
+            raise ValueError(f"Invalid object hash: {object_hash}")
+        # get the path to the object file
+        path = self._get_object_path(object_hash)
+        # create the shard dir on first touch; after warm-up the
+        # check is a set lookup instead of a mkdir syscall
+        shard = os.path.dirname(path)
+        if shard not in self._known_shards:
+            os.makedirs(shard, exist_ok=True)
+            self._known_shards.add(shard)
+        # objects are content-addressed and only ever appear under their
+        # final name via the rename below, so an existing file is
+        # guaranteed complete and can be skipped
+        if os.path.exists(path):
+            return
+        # write on a raw fd, skipping the BufferedWriter that
+        # write_bytes sets up per object; the temp name is unique per
+        # process and thread, so concurrent writers never collide
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+        flags |= getattr(os, "O_CLOEXEC", 0)
+        tmp_path = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+        fd = os.open(tmp_path, flags, 0o444)
+        try:
+            # os.write may write less than asked (signals, large
+            # buffers); loop over the remainder until done
+            remaining = memoryview(compressed_data)
+            while remaining:
+                remaining = remaining[os.write(fd, remaining) :]
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        os.close(fd)
+        # atomically publish the object; a crash mid-write leaves only
+        # the temp file behind, never a partial object
+        os.rename(tmp_path, path)
+
+    def _get_compression_level(self) -> int:
+        """Returns the compression level for loose objects.
+
+        Honors the 'core.compression' config value when set; the
+        default of 1 matches git's own default for loose objects,
+        trading a marginal size increase for far less CPU. The result
+        is memoized so per-object writes never re-read the config.
+
+        Returns:
+            int: The compression level (1-9).
+        """
+        if self._compression_level is not None:
+            return self._compression_level
+        level = 1
+        if self.config is not None and self.config.has_option("core", "compression"):
+            level = self.config.getint("core", "compression")
+        else:
+            # safe even outside a repository: _read_core_setting returns
+            # None when there is no config to read
+            value = self._read_core_setting("compression")
+            if value is not None:
+                level = int(value)
+        self._compression_level = level
+        return level
+
+    def _read_core_setting(self, key: str) -> str | None:
+        """Reads a single 'core' section value with a plain line scan.
+
+        The config _create_default_config writes is three keys, so a
+        line scan beats instantiating a ConfigParser for one lookup.
+
+        Args:
+            key (str): The option name inside the [core] section.
+
+        Returns:
+            str | None: The value, or None if the key was not found.
+        """
+        in_core = False
+        try:
+            with open(self._get_config_file()) as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("["):
+                        in_core = line == "[core]"
+                    elif in_core and "=" in line:
+                        name, _, value = line.partition("=")
+                        if name.strip() == key:
+                            return value.strip()
+        except OSError:
+            return None
+        return None
+
     def _find_index(self) -> str:
         """Finds the index file in the .git directory.
 
         Returns:
             str: Path to the index file.
         """
-        # find the .git directory
-        git_path = Path(self._get_git_dir())
-        path = git_path.joinpath("index")
-        return pathvalidate.sanitize_filepath(str(path.resolve()), platform="auto")
+        # the git dir is already validated, so a plain join is enough
+        return os.path.join(self._get_git_dir(), "index")
 
-    def _compress_object(self, data: bytes, level: int = 9) -> bytes:
+    @staticmethod
+    def _compress_object(header: bytes, data: bytes, level: int = 1) -> bytes:
         """Compress object data.
 
         Args:
-            data (bytes): The object to compress.
+            header (bytes): The object header.
+            data (bytes): The object payload.
             level (int): The compression level (1-9).
 
         Returns:
             bytes: The compressed object.
         """
-        # compress the object
-        return zlib.compress(data, level)
+        # libdeflate only does one-shot compression, but it is fast
+        # enough that the extra header copy is worth it; join() also
+        # accepts memoryview payloads
+        if deflate is not None:
+            return deflate.zlib_compress(b"".join((header, data)), level)
+        # feed the header and data into the compressor separately so the
+        # two buffers are never concatenated into a temporary copy
+        compressor = _fresh_compressor(level)
+        return (
+            compressor.compress(header)
+            + compressor.compress(data)
+            + compressor.flush()
+        )
 
     def _decompress_object(self, data: bytes) -> bytes:
         """Decompress object data.
@@ -267,6 +733,24 @@ class GitRepository:
         Returns:
             bytes: The decompressed object.
         """
+        if deflate is not None:
+            # libdeflate needs the output size up front, so decompress
+            # just enough with zlib to read the '<type> <size>\x00' header
+            probe = zlib.decompressobj()
+            head = probe.decompress(data, 64)
+            type_index = head.find(b" ")
+            size_index = head.find(b"\x00", type_index)
+            if type_index != -1 and size_index != -1:
+                object_size = int(head[type_index + 1 : size_index])
+                try:
+                    return bytes(
+                        deflate.zlib_decompress(data, size_index + 1 + object_size)
+                    )
+                except deflate.DeflateError:
+                    # a lying size header or corrupt stream: fall back
+                    # to zlib so failures (and the caller's size check)
+                    # behave the same with or without libdeflate
+                    pass
         # decompress the object
         return zlib.decompress(data)
 
@@ -279,13 +763,15 @@ class GitRepository:
         Returns:
             str: The path to the object.
         """
-        # get the first two characters of the hash
-        first_two_chars = hashed_object[:2]
-        # get the rest of the hash
-        rest_of_hash = hashed_object[2:]
-        # get the path to the object
-        path = self._get_object_dir(first_two_chars).joinpath(rest_of_hash)
-        return pathvalidate.sanitize_filepath(str(path.resolve()), platform="auto")
+        # hashes are hex, so the cached objects dir can be joined directly
+        # without re-sanitizing or resolving anything
+        if self._objects_dir is not None:
+            return str(
+                self._objects_dir.joinpath(hashed_object[:2], hashed_object[2:])
+            )
+        return os.path.join(
+            self._get_object_dir(hashed_object[:2]), hashed_object[2:]
+        )
 
     def _get_object_dir(self, first_two_chars: str) -> str:
         """Returns the path to the object directory.
@@ -297,9 +783,7 @@ class GitRepository:
             str: The path to the object directory.
         """
         # get the path to the object directory
-        git_dir = Path(self._get_git_dir())
-        path = git_dir.joinpath("objects").joinpath(first_two_chars)
-        return pathvalidate.sanitize_filepath(str(path.resolve()), platform="auto")
+        return os.path.join(self._get_git_dir(), "objects", first_two_chars)
 
     def _get_config_file(self) -> str:
         """Returns the path to the config file.
@@ -308,9 +792,7 @@ class GitRepository:
             str: The path to the config file.
         """
         # get the path to the config file
-        git_dir = Path(self._get_git_dir())
-        path = git_dir.joinpath("config")
-        return pathvalidate.sanitize_filepath(str(path.resolve()), platform="auto")
+        return os.path.join(self._get_git_dir(), "config")
 
     def _get_git_dir(self) -> str:
         """Returns the path to the .git directory.
@@ -318,8 +800,12 @@ class GitRepository:
         Returns:
             str: The path to the .git directory.
         """
-        # get the path to the .git directory
-        cwd = Path(self.worktree).resolve()
+        # reuse the path cached by init(); recompute only before init() ran
+        if self._git_dir_path is not None:
+            return str(self._git_dir_path)
+        # get the path to the .git directory, defaulting to the current
+        # directory when no worktree was set (CLI use without init)
+        cwd = Path(self.worktree or ".").resolve()
         git_dir = cwd.joinpath(".git")
         if not git_dir.exists():
             raise FileNotFoundError(f"Directory is not a Git repository: {str(cwd)}")
@@ -388,6 +874,28 @@ class GitRepository:
         return str(resolved_repo)
 
 
+def _hash_and_compress(work_item: tuple) -> tuple:
+    """Hashes and compresses one file inside a pool worker.
+
+    Module-level so it can be pickled into worker processes; the
+    parent is responsible for writing the result to disk.
+
+    Args:
+        work_item (tuple): (path, obj_type, compression level).
+
+    Returns:
+        tuple: (object hash, compressed object).
+    """
+    path, obj_type, level = work_item
+    data = Path(path).read_bytes()
+    header = _object_header(obj_type, len(data))
+    hasher = _sha1_new()
+    hasher.update(header)
+    hasher.update(data)
+    compressed_data = GitRepository._compress_object(header, data, level)
+    return hasher.hexdigest(), compressed_data
+
+
 def main(argv: List[str] = sys.argv[1:]) -> None:
     git = GitRepository()
     # create an argument parser
@@ -400,7 +908,7 @@ def main(argv: List[str] = sys.argv[1:]) -> None:
     # add the repo argument
     init.add_argument("repo", nargs="?", default=".", help="Path to the new repo.")
     # bind the action to the function
-    init.set_defaults(func=git.init)
+    init.set_defaults(func=lambda args: git.init(args.repo))
 
     # create a subparser for the cat-file command
     cat_file = commands.add_parser(
@@ -424,7 +932,14 @@ def main(argv: List[str] = sys.argv[1:]) -> None:
     # add the hash argument
     cat_file.add_argument("hash", help="The hash of the object.")
     # bind the action to the function
-    cat_file.set_defaults(func=git.cat_file)
+    cat_file.set_defaults(
+        func=lambda args: git.cat_file(
+            args.hash,
+            ptype=args.type is not None,
+            psize=args.size,
+            pprint=args.pretty,
+        )
+    )
 
     # create a subparser for the hash-object command
     hash_object = commands.add_parser(
@@ -445,11 +960,34 @@ def main(argv: List[str] = sys.argv[1:]) -> None:
         action="store_true",
         help="Write the object into the object database.",
     )
+    # add the stdin-paths argument
+    hash_object.add_argument(
+        "--stdin-paths",
+        action="store_true",
+        help="Read NUL-separated paths from stdin and hash each one.",
+    )
     # add the path argument
     hash_object.add_argument(
         "path",
+        nargs="?",
         type=sanitize_filepath_arg,
         help="The path to the file to read the object from.",
     )
+
+    def _run_hash_object(args) -> None:
+        if args.stdin_paths:
+            # read NUL-separated paths from stdin and hash the batch
+            raw_paths = sys.stdin.buffer.read().split(b"\x00")
+            paths = [raw.decode() for raw in raw_paths if raw]
+            git.hash_objects(paths, args.type, args.write)
+        elif args.path is not None:
+            git.hash_object(args.path, args.type, args.write)
+        else:
+            parser.error("hash-object requires a path or --stdin-paths")
+
     # bind the action to the function
-    hash_object.set_defaults(func=git.hash_object)
+    hash_object.set_defaults(func=_run_hash_object)
+
+    # parse the arguments and run the selected command
+    args = parser.parse_args(argv)
+    args.func(args)